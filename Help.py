@@ -49,6 +49,9 @@ Preferences keys (in "User parameter:BaseApp/Preferences/Mod/Help"):
     Location (string): offline location
     Suffix (string): a suffix to add to the URL, ex: /fr
     StyleSheet (string): optional CSS stylesheet to style the output
+    GithubToken (string): optional github token, raises the markdown API rate limit
+    GithubAPIURL (string): github API location, ex: a local server for testing
+        (the github token is only sent to the official API)
 """
 
 import os
@@ -65,10 +68,14 @@ WIKI_URL = "https://wiki.freecad.org"
 MD_RAW_URL = "https://raw.githubusercontent.com/FreeCAD/FreeCAD-documentation/main/wiki"
 MD_RENDERED_URL = "https://github.com/FreeCAD/FreeCAD-documentation/blob/main/wiki"
 MD_TRANSLATIONS_FOLDER = "translations"
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_RESERVE = 5  # API calls kept aside for the user's other github tools
 ERRORTXT = translate("Help","Contents for this page could not be retrieved. Please check settings under menu Edit -> Preferences -> General -> Help")
 LOCTXT = translate("Help","Help files location could not be determined. Please check settings under menu Edit -> Preferences -> General -> Help")
 LOGTXT = translate("Help","PySide2 QtWebEngineWidgets module is not available. Help rendering is done with the Web module")
 CONVERTTXT = translate("Help","There is no markdown renderer installed on your system, so this help page is rendered as is. Please install the markdown or pandoc python modules to improve the rendering of this page.")
+GITHUBTXT = translate("Help","The Github markdown API is rate limited or unreachable, so this page is rendered locally. Setting a Github token under menu Edit -> Preferences -> General -> Help raises the rate limit.")
+GITHUBNETTXT = translate("Help","The Github markdown API is unreachable, no more pages will be rendered")
 PREFS = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Help")
 ICON = ":/icons/help-browser.svg"
 
@@ -280,21 +287,6 @@ def convert(content, force=None):
         except:
             return None
 
-    def convert_github(m):
-        try:
-            import json
-            import urllib.request
-
-            data = {"text": m, "mode": "markdown"}
-            bdata = json.dumps(data).encode("utf-8")
-            return (
-                urllib.request.urlopen("https://api.github.com/markdown", data=bdata)
-                .read()
-                .decode("utf8")
-            )
-        except:
-            return None
-
     def convert_raw(m):
         # simple and dirty regex-based markdown to html
         f = re.DOTALL | re.MULTILINE
@@ -317,23 +309,28 @@ def convert(content, force=None):
         # this is html already
         return content
 
-    if force == "markdown":
+    html = None
+    if force == "github":
+        html = convert_github(content)
+    if html:
+        pass
+    elif force == "markdown":
         html = convert_markdown(content)
     elif force == "pandoc":
         html = convert_pandoc(content)
-    elif force == "github":
-        html = convert_github(content)
     elif force in ["raw", "builtin"]:
         html = convert_raw(content)
     elif force == "none":
         return content
     else:
-        # auto mode
+        # auto mode, or github API not available
         html = convert_pandoc(content)
         if not html:
             html = convert_markdown(content)
             if not html:
                 html = convert_raw(content)
+        if force == "github":
+            html += "\n<br/><hr/><small>" + GITHUBTXT + "</small>"
     if not "<html" in html:
         html = (
             '<html>\n<head>\n<meta charset="utf-8"/>\n</head>\n<body>\n\n'
@@ -362,6 +359,257 @@ def convert(content, force=None):
     return html
 
 
+def convert_github(content):
+    """converts the given markdown code to html using the github markdown API.
+    Results are cached on disk by content hash, and None is returned when the
+    API is unreachable or its rate limit is about to be exhausted, so the
+    caller can fall back to a local converter"""
+
+    cachefile = get_github_cache_file(content)
+    if os.path.exists(cachefile):
+        try:
+            with open(cachefile, mode="r", encoding="utf8") as f:
+                return f.read()
+        except (OSError, UnicodeDecodeError):
+            # unusable cache file, render the page again
+            pass
+    if not has_github_budget():
+        return None
+    try:
+        html = fetch_github(content)
+    except (OSError, ValueError):
+        return None
+    set_github_cache(content, html)
+    return html
+
+
+def set_github_cache(content, html):
+    """stores the github rendering of the given markdown in the cache"""
+
+    cachefile = get_github_cache_file(content)
+    try:
+        os.makedirs(os.path.dirname(cachefile), exist_ok=True)
+        with open(cachefile + ".tmp", mode="w", encoding="utf8") as f:
+            f.write(html)
+        os.replace(cachefile + ".tmp", cachefile)
+    except OSError:
+        FreeCAD.Console.PrintLog("Help: Unable to write cache file " + cachefile + "\n")
+
+
+def fetch_github(content):
+    """renders the given markdown code with the github markdown API, bypassing
+    the cache and the rate limit budget. Raises urllib.error.HTTPError on API
+    errors, other OSErrors when the API is unreachable and ValueError on
+    undecodable responses. The token is only sent to the official API"""
+
+    import json
+    import urllib.request
+    import urllib.error
+
+    url = get_github_api_url()
+    data = {"text": content, "mode": "markdown"}
+    bdata = json.dumps(data).encode("utf-8")
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "Content-Type": "application/json",
+    }
+    token = PREFS.GetString("GithubToken", "")
+    if token and url == GITHUB_API_URL:
+        headers["Authorization"] = "Bearer " + token
+    request = urllib.request.Request(url + "/markdown", data=bdata, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=10) as r:
+            set_github_rate(r.headers)
+            return r.read().decode("utf8")
+    except urllib.error.HTTPError as e:
+        set_github_rate(e.headers, e.code)
+        FreeCAD.Console.PrintLog("Help: github markdown API error " + str(e.code) + "\n")
+        raise
+
+
+def get_github_api_url():
+    """returns the github API location set in the preferences, without trailing slash"""
+
+    return PREFS.GetString("GithubAPIURL", GITHUB_API_URL).rstrip("/")
+
+
+def get_github_api_key():
+    """returns a short key identifying the current github API location, used to
+    keep the cache and rate limit state of different API servers apart"""
+
+    import hashlib
+
+    return hashlib.sha256(get_github_api_url().encode("utf8")).hexdigest()[:16]
+
+
+def get_github_cache_dir():
+    """returns the folder holding the github renderings and rate limit state of all API locations"""
+
+    try:
+        cachedir = FreeCAD.getUserCachePath()
+    except AttributeError:
+        # FreeCAD versions before 0.20
+        cachedir = os.path.join(FreeCAD.getUserAppDataDir(), "Cache")
+    return os.path.join(cachedir, "Help", "github")
+
+
+def get_github_cache_file(content):
+    """returns the path of the cache file holding the github rendering of the given markdown"""
+
+    import hashlib
+
+    digest = hashlib.sha256(content.encode("utf8")).hexdigest()
+    return os.path.join(get_github_cache_dir(), get_github_api_key(), digest + ".html")
+
+
+def clear_github_cache():
+    """deletes all cached github renderings and the stored rate limit state"""
+
+    import shutil
+
+    shutil.rmtree(get_github_cache_dir(), ignore_errors=True)
+
+
+def get_github_rate():
+    """returns the stored rate limit state of the current API location, as a
+    dict with remaining, reset and failures keys"""
+
+    import json
+
+    ratefile = os.path.join(get_github_cache_dir(), "rate.json")
+    try:
+        with open(ratefile, mode="r", encoding="utf8") as f:
+            rate = json.load(f).get(get_github_api_key(), {})
+    except (OSError, ValueError, AttributeError):
+        rate = {}
+    if not isinstance(rate, dict):
+        rate = {}
+    defaults = {"remaining": -1, "reset": 0, "failures": 0}
+    for key, value in defaults.items():
+        try:
+            defaults[key] = int(rate.get(key, value))
+        except (TypeError, ValueError):
+            pass
+    return defaults
+
+
+def has_github_budget():
+    """returns True if the github markdown API can still be called without
+    eating into the last GITHUB_RESERVE calls of the current rate limit window"""
+
+    import time
+
+    rate = get_github_rate()
+    if rate["remaining"] < 0 or time.time() >= rate["reset"]:
+        # unknown, or a new rate limit window started
+        return True
+    return rate["remaining"] > GITHUB_RESERVE
+
+
+def set_github_rate(headers, code=200):
+    """stores the rate limit state given by the X-RateLimit-* headers of a github API response"""
+
+    import json
+    import time
+
+    def get_int(name):
+        try:
+            return int(headers.get(name))
+        except (TypeError, ValueError):
+            return None
+
+    rate = get_github_rate()
+    remaining = get_int("X-RateLimit-Remaining")
+    reset = get_int("X-RateLimit-Reset")
+    if code in [403, 429]:
+        # rate limited, possibly by a secondary limit while the primary
+        # headers still show calls left. Github asks to wait at least a
+        # minute then, and longer if calls keep failing
+        rate["failures"] += 1
+        retry = get_int("Retry-After")
+        if retry is None:
+            retry = 60 * 2 ** min(rate["failures"] - 1, 5)
+            retry = max(retry, (reset or 0) - int(time.time()))
+        remaining = 0
+        reset = int(time.time()) + retry
+    else:
+        rate["failures"] = 0
+    if remaining is not None:
+        rate["remaining"] = remaining
+    if reset is not None:
+        rate["reset"] = reset
+    ratefile = os.path.join(get_github_cache_dir(), "rate.json")
+    try:
+        with open(ratefile, mode="r", encoding="utf8") as f:
+            rates = json.load(f)
+        if not isinstance(rates, dict):
+            rates = {}
+    except (OSError, ValueError):
+        rates = {}
+    rates[get_github_api_key()] = rate
+    try:
+        os.makedirs(os.path.dirname(ratefile), exist_ok=True)
+        with open(ratefile + ".tmp", mode="w", encoding="utf8") as f:
+            json.dump(rates, f)
+        os.replace(ratefile + ".tmp", ratefile)
+    except OSError:
+        FreeCAD.Console.PrintLog("Help: Unable to write " + ratefile + "\n")
+
+
+def prerender(pages):
+    """
+    prerender(pages):
+    Renders the given list of pages (names, URLs or file paths, as accepted by
+    show()) with the github markdown API and stores them in the cache, so they
+    open instantly and without API calls later on. Pages already cached cost
+    nothing. Once the API is rate limited or unreachable, the remaining pages
+    are only checked against the cache. Returns the list of pages that could
+    not be rendered, which can be passed again later.
+    """
+
+    import urllib.error
+
+    failed = []
+    exhausted = False
+    for page in list(pages):
+        location = get_location(underscore_page(page))
+        if not location:
+            failed.append(page)
+            continue
+        md = get_contents(location)
+        if md == ERRORTXT or "<html" in md:
+            # nothing to render
+            failed.append(page)
+            continue
+        if os.path.exists(get_github_cache_file(md)):
+            continue
+        if not exhausted and not has_github_budget():
+            FreeCAD.Console.PrintWarning("Help: " + GITHUBTXT + "\n")
+            exhausted = True
+        if exhausted:
+            failed.append(page)
+            continue
+        try:
+            html = fetch_github(md)
+        except urllib.error.HTTPError as e:
+            failed.append(page)
+            if e.code in [403, 429]:
+                FreeCAD.Console.PrintWarning("Help: " + GITHUBTXT + "\n")
+                exhausted = True
+            continue
+        except OSError:
+            # unreachable or timed out, don't wait on every remaining page
+            FreeCAD.Console.PrintWarning("Help: " + GITHUBNETTXT + "\n")
+            failed.append(page)
+            exhausted = True
+            continue
+        except ValueError:
+            failed.append(page)
+            continue
+        set_github_cache(md, html)
+    return failed
+
+
 def add_preferences_page():
     """adds the Help preferences page to the UI"""
 